@@ -9,127 +9,388 @@ copied as a snippet into other projects or run ad-hoc from the CLI.
 from __future__ import annotations
 
 import argparse
+import base64
+import functools
+import gzip
+import http.client
+import io
+import itertools
 import json
+import os
 import re
+import string
 import sys
+import tempfile
 import textwrap
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from typing import Dict, Iterable, List
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Tuple
 
 
 PYPI_JSON_URL = "https://pypi.org/pypi/{package}/json"
 USER_AGENT = "SoftwareCitationStation/0.1 (+https://github.com/zonca/software_citation_station)"
+PYTHON_LANGUAGE_PREFIX = "Programming Language :: Python"
+LANGUAGE_PREFIX = "Programming Language ::"
+TOPIC_PREFIX = "Topic ::"
+AUDIENCE_PREFIX = "Intended Audience ::"
+MAX_REDIRECTS = 10
+MAX_RETRIES = 2
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 15.0
+PROBE_TIMEOUT = 5.0
+RETRY_BACKOFF = 0.3
+MAX_WORKERS = 8
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "software_citation_station"
+URL_EXISTS_CACHE = CACHE_DIR / "url_exists.json"
+PYPI_CACHE_DIR = CACHE_DIR / "pypi"
+URL_EXISTS_TTL = 24 * 60 * 60
+MISSING_STATUSES = (404, 410)
+
+_KW_TRANSLATE = str.maketrans({";": ",", "|": ",", "\n": ","})
+_PEP503_SEPARATORS_RE = re.compile(r"[-_.]+")
+_PEP503_NAME_RE = re.compile(r"[a-z0-9](?:[a-z0-9-]*[a-z0-9])?")
+_DEPNAME_RE = re.compile(r"\s*([A-Za-z0-9._-]+)")
+_GITHUB_RE = re.compile(r"https?://github\.com/([^/\s]+)/([^/\s#]+)")
+# Collapses whitespace runs (group 1) and drops Markdown markup (group 2) in one pass.
+_SUMMARY_RE = re.compile(r"(\s+)|([`*_#<>])")
+_BRACE_RE = re.compile(r"[{}]")
+_BIBTEX_SPECIAL_RE = re.compile(r'[{}",]')
+_DOI_RE = re.compile(r"10\.\d{4,9}/[-._;()/:A-Za-z0-9]+")
+
+# Keep-alive connections keyed by (scheme, netloc) so repeated calls to the same
+# host (pypi.org, doi.org, raw.githubusercontent.com) skip the TCP/TLS handshake.
+# http.client connections are not thread-safe, so each worker thread gets its own.
+_THREAD_STATE = threading.local()
+# Every thread's pool is also registered here so close_connections() can reach them.
+_POOLS: List[Dict] = []
+_POOLS_LOCK = threading.Lock()
+_TRANSIENT_ERRORS = (TimeoutError, ConnectionError, http.client.IncompleteRead, http.client.BadStatusLine)
+
+
+def _connections() -> Dict[Tuple[str, str], Tuple[http.client.HTTPConnection, bool, Dict[str, str]]]:
+    pool = getattr(_THREAD_STATE, "connections", None)
+    if pool is None:
+        pool = _THREAD_STATE.connections = {}
+        with _POOLS_LOCK:
+            _POOLS.append(pool)
+    return pool
+
+
+def close_connections() -> None:
+    # Call once no requests are in flight, e.g. after the worker executor has shut down.
+    with _POOLS_LOCK:
+        pools = list(_POOLS)
+    for pool in pools:
+        for connection, _, _ in pool.values():
+            connection.close()
+        pool.clear()
+
+
+def _new_connection(scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool, Dict[str, str]]:
+    # Honour HTTP(S)_PROXY/NO_PROXY the same way urllib.request.urlopen does. Returns the
+    # connection, whether requests must use the absolute URL, and extra per-request headers.
+    host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc), False, {}
+        return http.client.HTTPConnection(netloc), False, {}
+
+    proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    proxy_netloc = proxy_parts.netloc.rpartition("@")[2]
+    proxy_headers = {}
+    if proxy_parts.username:
+        username = urllib.parse.unquote(proxy_parts.username)
+        password = urllib.parse.unquote(proxy_parts.password or "")
+        credentials = f"{username}:{password}"
+        proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+    if scheme == "https":
+        connection = http.client.HTTPSConnection(proxy_netloc)
+        connection.set_tunnel(netloc, headers=proxy_headers)
+        return connection, False, {}
+    return http.client.HTTPConnection(proxy_netloc), True, proxy_headers
+
+
+def _get_connection(scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool, Dict[str, str]]:
+    pool = _connections()
+    key = (scheme, netloc)
+    entry = pool.get(key)
+    if entry is None:
+        entry = _new_connection(scheme, netloc)
+        pool[key] = entry
+    return entry
+
+
+def _drop_connection(scheme: str, netloc: str) -> None:
+    entry = _connections().pop((scheme, netloc), None)
+    if entry is not None:
+        entry[0].close()
+
+
+def http_request(
+    url: str,
+    method: str = "GET",
+    headers: Mapping[str, str] | None = None,
+    timeout: float = READ_TIMEOUT,
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    # Errors mirror urllib.request.urlopen so callers keep catching HTTPError/URLError.
+    request_headers = {"User-Agent": USER_AGENT}
+    request_headers.update(headers or {})
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported URL scheme: {url}")
+        path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        attempt = 0
+        while True:
+            connection, absolute_target, proxy_headers = _get_connection(parts.scheme, parts.netloc)
+            reused = connection.sock is not None
+            try:
+                if not reused:
+                    connection.timeout = min(CONNECT_TIMEOUT, timeout)
+                    connection.connect()
+                connection.sock.settimeout(timeout)
+                target = urllib.parse.urlunsplit(parts._replace(fragment="")) if absolute_target else path
+                connection.request(method, target, headers={**request_headers, **proxy_headers})
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError, UnicodeError) as error:
+                _drop_connection(parts.scheme, parts.netloc)
+                if reused and isinstance(error, ConnectionError):
+                    # The server closed an idle keep-alive socket; reconnect right away.
+                    continue
+                # Bad URLs, DNS failures and certificate errors will not fix themselves.
+                if attempt == MAX_RETRIES or not isinstance(error, _TRANSIENT_ERRORS):
+                    raise urllib.error.URLError(error) from error
+                time.sleep(RETRY_BACKOFF * (2**attempt))
+                attempt += 1
+        if response.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+
+        location = response.getheader("Location")
+        if response.status in (301, 302, 303, 307, 308) and location:
+            # Quote the raw header like urllib's HTTPRedirectHandler so spaces and
+            # non-ASCII characters do not reach http.client unescaped.
+            location = urllib.parse.quote(location, encoding="iso-8859-1", safe=string.punctuation)
+            url = urllib.parse.urljoin(url, location)
+            if response.status == 303 and method != "HEAD":
+                method = "GET"
+            continue
+        if response.status >= 400:
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.msg, None)
+        return response.status, response.msg, body
+    raise urllib.error.URLError(f"too many redirects: {url}")
+
+
+def load_json_cache(path: Path) -> Dict:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json_cache(path: Path, data: Dict) -> None:
+    # Write to a temporary file first so concurrent runs never see a partial file.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as handle:
+            json.dump(data, handle)
+        os.replace(handle.name, path)
+    except OSError:
+        pass
+
+
+def pypi_cache_path(package: str) -> Path | None:
+    # Key the cache by the PEP 503 normalized name so "Foo_Bar" and "foo-bar" share an
+    # entry; anything that is not a valid project name (e.g. "../x") is never cached.
+    normalized = _PEP503_SEPARATORS_RE.sub("-", package).lower()
+    if not _PEP503_NAME_RE.fullmatch(normalized):
+        return None
+    return PYPI_CACHE_DIR / f"{normalized}.json"
+
 
 def get_pypi_payload(package: str) -> Dict:
     url = PYPI_JSON_URL.format(package=package)
-    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(request) as response:  # type: ignore[call-arg]
-        return json.load(response)
+    cache_path = pypi_cache_path(package)
+    cached = load_json_cache(cache_path) if cache_path else {}
+    request_headers = {"Accept-Encoding": "gzip"}
+    if "payload" in cached:
+        # Revalidate the stored payload; PyPI answers 304 with no body when unchanged.
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    status, headers, body = http_request(url, headers=request_headers)
+    if status == 304 and "payload" in cached:
+        return cached["payload"]
+    if headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    payload = json.loads(body)
+
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if cache_path and (etag or last_modified):
+        save_json_cache(cache_path, {"etag": etag, "last_modified": last_modified, "payload": payload})
+    return payload
 
 
 def normalize_keywords(raw_keywords: str | None) -> List[str]:
     if not raw_keywords:
         return []
     # PyPI keywords are usually a comma or space separated string.
-    cleaned = re.sub(r"[;|]", ",", raw_keywords)
-    parts = [part.strip() for part in cleaned.replace("\n", ",").split(",")]
+    parts = (part.strip() for part in raw_keywords.translate(_KW_TRANSLATE).split(","))
     return [part for part in parts if part]
 
 
 def extract_language(classifiers: Iterable[str]) -> str:
+    fallback = ""
     for classifier in classifiers:
-        if classifier.startswith("Programming Language :: Python"):
+        if classifier.startswith(PYTHON_LANGUAGE_PREFIX):
             return "Python"
-    for classifier in classifiers:
-        if classifier.startswith("Programming Language ::"):
-            return classifier.split("::")[-1].strip()
-    return ""
+        if not fallback and classifier.startswith(LANGUAGE_PREFIX):
+            fallback = classifier.split("::")[-1].strip()
+    return fallback
 
 
 def extract_category(classifiers: Iterable[str]) -> str:
+    fallback = ""
     for classifier in classifiers:
-        if classifier.startswith("Topic ::"):
+        if classifier.startswith(TOPIC_PREFIX):
             return classifier.split("::")[-1].strip()
-    for classifier in classifiers:
-        if classifier.startswith("Intended Audience ::"):
-            return classifier.split("::")[-1].strip()
-    return ""
+        if not fallback and classifier.startswith(AUDIENCE_PREFIX):
+            fallback = classifier.split("::")[-1].strip()
+    return fallback
 
 
 def simplify_dependency(requirement: str) -> str:
-    requirement = requirement.split(";", 1)[0].strip()
-    requirement = requirement.split("[", 1)[0].strip()
-    requirement = re.split(r"[<>=!~() ]", requirement, maxsplit=1)[0].strip()
-    return requirement
+    match = _DEPNAME_RE.match(requirement)
+    return match.group(1) if match else ""
 
 
 def gather_dependencies(requires_dist: Iterable[str] | None) -> List[str]:
     if not requires_dist:
         return []
-    simplified = {
-        simplify_dependency(req)
-        for req in requires_dist
-        if req and "extra ==" not in req
-    }
-    return sorted(dep for dep in simplified if dep)
+    simplified = (simplify_dependency(req) for req in requires_dist if req and "extra ==" not in req)
+    return sorted(set(filter(None, simplified)))
+
+
+class GitHubRepo(NamedTuple):
+    url: str = ""
+    owner: str = ""
+    name: str = ""
 
 
-def normalize_github_repo(url: str) -> str:
+def normalize_github_repo(url: str) -> GitHubRepo:
+    # Keeps owner/name alongside the canonical URL so callers do not have to re-parse it.
     if not url:
-        return ""
-    match = re.search(r"https?://github\.com/([^/\s]+)/([^/\s#]+)", url)
+        return GitHubRepo()
+    match = _GITHUB_RE.search(url)
     if not match:
-        return ""
-    owner, repo = match.groups()
-    repo = repo.rstrip(".git")
-    return f"https://github.com/{owner}/{repo}"
+        return GitHubRepo()
+    owner, name = match.groups()
+    name = name.removesuffix(".git")
+    if not name:
+        return GitHubRepo()
+    return GitHubRepo(f"https://github.com/{owner}/{name}", owner, name)
 
 
-def extract_repo_path(repo_url: str) -> str:
-    path = repo_url.replace("https://github.com/", "").replace("http://github.com/", "").strip("/")
-    parts = path.split("/")
-    if len(parts) >= 2:
-        return "/".join(parts[:2])
-    return ""
+_URL_EXISTS_LOCK = threading.Lock()
+_url_exists_disk: Dict[str, List] | None = None
+_url_exists_dirty = False
 
 
-def url_exists(url: str) -> bool:
-    if not url:
-        return False
-    request = urllib.request.Request(url, method="HEAD", headers={"User-Agent": USER_AGENT})
+def _probe_url(url: str) -> bool | None:
+    # Only 404/410 mean "missing". None marks an unknown answer (network failure, rate
+    # limiting, server error) that must not be persisted.
     try:
-        with urllib.request.urlopen(request):
-            return True
+        http_request(url, method="HEAD", timeout=PROBE_TIMEOUT)
+        return True
     except urllib.error.HTTPError as error:
-        if error.code == 405:
-            fallback_request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-            try:
-                with urllib.request.urlopen(fallback_request):
-                    return True
-            except urllib.error.URLError:
-                return False
-        return False
+        if error.code != 405:
+            return False if error.code in MISSING_STATUSES else None
     except urllib.error.URLError:
+        return None
+    # Servers that reject HEAD usually honour a one-byte range (200 or 206). An empty
+    # file cannot satisfy any range and answers 416, which still means it exists.
+    try:
+        http_request(url, headers={"Range": "bytes=0-0"}, timeout=PROBE_TIMEOUT)
+        return True
+    except urllib.error.HTTPError as error:
+        if error.code == 416:
+            return True
+        return False if error.code in MISSING_STATUSES else None
+    except urllib.error.URLError:
+        return None
+
+
+def _fresh_url_entries(entries: Dict) -> Dict[str, List]:
+    now = time.time()
+    return {
+        url: entry
+        for url, entry in entries.items()
+        if isinstance(entry, list)
+        and len(entry) == 2
+        and isinstance(entry[0], (int, float))
+        and now - entry[0] < URL_EXISTS_TTL
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def url_exists(url: str) -> bool:
+    global _url_exists_disk, _url_exists_dirty
+    if not url:
+        return False
+    with _URL_EXISTS_LOCK:
+        if _url_exists_disk is None:
+            _url_exists_disk = _fresh_url_entries(load_json_cache(URL_EXISTS_CACHE))
+        cached = _url_exists_disk.get(url)
+    if cached and time.time() - cached[0] < URL_EXISTS_TTL:
+        return bool(cached[1])
+
+    exists = _probe_url(url)
+    if exists is None:
         return False
+    with _URL_EXISTS_LOCK:
+        _url_exists_disk[url] = [time.time(), exists]
+        _url_exists_dirty = True
+    return exists
 
 
-def find_github_repo(info: Dict) -> str:
+def save_url_exists_cache() -> None:
+    # Probes only record their answers in memory; this writes them out once per run.
+    global _url_exists_disk, _url_exists_dirty
+    with _URL_EXISTS_LOCK:
+        if _url_exists_disk is None or not _url_exists_dirty:
+            return
+        _url_exists_disk = _fresh_url_entries(_url_exists_disk)
+        _url_exists_dirty = False
+        entries = dict(_url_exists_disk)
+    save_json_cache(URL_EXISTS_CACHE, entries)
+
+
+def find_github_repo(info: Dict) -> GitHubRepo:
     project_urls = info.get("project_urls") or {}
-    candidates = list(project_urls.values())
-    for key in ("home_page", "project_url"):
-        val = info.get(key)
-        if val:
-            candidates.append(val)
+    candidates = itertools.chain(
+        project_urls.values(),
+        (info.get(key) for key in ("home_page", "project_url")),
+    )
     for candidate in candidates:
         repo = normalize_github_repo(candidate or "")
-        if repo:
+        if repo.url:
             return repo
     description = info.get("description") or ""
-    repo = normalize_github_repo(description)
-    if repo:
-        return repo
-    return ""
+    return normalize_github_repo(description)
 
 
 def primary_homepage(info: Dict) -> str:
@@ -141,21 +402,25 @@ def primary_homepage(info: Dict) -> str:
     return info.get("home_page") or ""
 
 
-def find_attribution_link(info: Dict) -> str:
+def find_attribution_link(info: Dict, executor: Executor | None = None) -> str:
     project_urls = info.get("project_urls") or {}
     for key, url in project_urls.items():
         if "cite" in key.lower() or "citation" in key.lower():
             return url
-    repo_url = find_github_repo(info)
-    if repo_url:
+    repo = find_github_repo(info)
+    if repo.url:
         citation_paths = ["CITATION", "CITATION.cff", "CITATION.md"]
         branches = ["main", "master"]
-        for branch in branches:
-            for name in citation_paths:
-                blob_url = f"{repo_url}/blob/{branch}/{name}"
-                raw_url = f"https://raw.githubusercontent.com/{extract_repo_path(repo_url)}/{branch}/{name}"
-                if url_exists(raw_url):
-                    return blob_url
+        candidates = [(branch, name) for branch in branches for name in citation_paths]
+        raw_urls = [
+            f"https://raw.githubusercontent.com/{repo.owner}/{repo.name}/{branch}/{name}"
+            for branch, name in candidates
+        ]
+        # Probe every candidate concurrently; results come back in priority order.
+        mapper = executor.map if executor is not None else map
+        for (branch, name), exists in zip(candidates, mapper(url_exists, raw_urls)):
+            if exists:
+                return f"{repo.url}/blob/{branch}/{name}"
     return ""
 
 
@@ -164,35 +429,29 @@ def cleaned_summary(info: Dict) -> str:
     if summary:
         return summary
     description = (info.get("description") or "").strip()
-    description = re.sub(r"\s+", " ", description)
-    description = re.sub(r"[`*_#<>]", "", description)
+    description = _SUMMARY_RE.sub(lambda match: " " if match.group(1) else "", description)
     return textwrap.shorten(description, width=240, placeholder="...")
 
 
 def extract_dois(info: Dict) -> List[str]:
-    text_fragments = [
-        info.get("summary") or "",
-        info.get("description") or "",
-    ]
     project_urls = info.get("project_urls") or {}
-    text_fragments.extend(project_urls.values())
-    doi_pattern = re.compile(r"10\.\d{4,9}/[-._;()/:A-Za-z0-9]+")
-    found = {match.rstrip(".,)") for match in doi_pattern.findall(" ".join(text_fragments))}
+    text_fragments = itertools.chain(
+        (info.get("summary"), info.get("description")),
+        project_urls.values(),
+    )
+    # Scan each fragment separately rather than joining potentially large descriptions.
+    found = set()
+    for fragment in text_fragments:
+        if fragment:
+            found.update(match.group().rstrip(".,)") for match in _DOI_RE.finditer(fragment))
     return sorted(found)
 
 
 def fetch_bibtex(doi: str) -> str | None:
     url = f"https://doi.org/{doi}"
-    request = urllib.request.Request(
-        url,
-        headers={
-            "Accept": "application/x-bibtex; charset=utf-8",
-            "User-Agent": USER_AGENT,
-        },
-    )
     try:
-        with urllib.request.urlopen(request) as response:  # type: ignore[call-arg]
-            return response.read().decode("utf-8").strip()
+        _, _, body = http_request(url, headers={"Accept": "application/x-bibtex; charset=utf-8"})
+        return body.decode("utf-8").strip()
     except urllib.error.URLError:
         return None
 
@@ -214,29 +473,26 @@ def ensure_value(value, *, fallback: str | List[str]):
 
 def split_bibtex_fields(fields_part: str) -> List[str]:
     parts: List[str] = []
-    current: List[str] = []
     brace_depth = 0
     in_quotes = False
-    i = 0
-    while i < len(fields_part):
-        char = fields_part[i]
+    start = 0
+    # Only visit structural characters; field bodies between them are sliced whole.
+    for match in _BIBTEX_SPECIAL_RE.finditer(fields_part):
+        char = match.group()
+        index = match.start()
         if char == '"':
             in_quotes = not in_quotes
         elif char == "{":
             brace_depth += 1
         elif char == "}":
             brace_depth = max(brace_depth - 1, 0)
-
-        if char == "," and brace_depth == 0 and not in_quotes:
-            part = "".join(current).strip()
+        elif brace_depth == 0 and not in_quotes:
+            part = fields_part[start:index].strip()
             if part:
                 parts.append(part)
-            current = []
-        else:
-            current.append(char)
-        i += 1
+            start = index + 1
 
-    remainder = "".join(current).strip()
+    remainder = fields_part[start:].strip()
     if remainder:
         parts.append(remainder)
     return parts
@@ -255,18 +511,16 @@ def format_bibtex_entry(entry: str, indent: str = "  ") -> str:
     entry_type = text[type_start:type_end].strip()
     remainder = text[type_end + 1 :]
     brace_depth = 1
-    index = 0
-    while index < len(remainder) and brace_depth > 0:
-        char = remainder[index]
-        if char == "{":
-            brace_depth += 1
-        elif char == "}":
-            brace_depth -= 1
-        index += 1
-    if brace_depth != 0:
+    end = -1
+    for match in _BRACE_RE.finditer(remainder):
+        brace_depth += 1 if match.group() == "{" else -1
+        if brace_depth == 0:
+            end = match.start()
+            break
+    if end < 0:
         return text
 
-    body = remainder[: index - 1].strip()
+    body = remainder[:end].strip()
     if "," not in body:
         return text
 
@@ -292,14 +546,20 @@ def format_bibtex_entry(entry: str, indent: str = "  ") -> str:
     return "\n".join(lines)
 
 
-def build_metadata(package: str, payload: Dict) -> Dict:
+def build_metadata(
+    package: str,
+    payload: Dict,
+    executor: Executor | None = None,
+    doi_list: List[str] | None = None,
+) -> Dict:
     info = payload["info"]
     classifiers = info.get("classifiers") or []
     keywords = normalize_keywords(info.get("keywords"))
     deps = gather_dependencies(info.get("requires_dist"))
     langs = extract_language(classifiers)
     category = extract_category(classifiers)
-    doi_list = extract_dois(info)
+    if doi_list is None:
+        doi_list = extract_dois(info)
     defaults = {
         "tags": ["FIXME"],
         "logo": "FIXME",
@@ -322,7 +582,7 @@ def build_metadata(package: str, payload: Dict) -> Dict:
         "keywords": ensure_value(keywords, fallback=defaults["keywords"]),
         "description": ensure_value(cleaned_summary(info), fallback=defaults["description"]),
         "link": ensure_value(primary_homepage(info), fallback=defaults["link"]),
-        "attribution_link": ensure_value(find_attribution_link(info), fallback=defaults["attribution_link"]),
+        "attribution_link": ensure_value(find_attribution_link(info, executor), fallback=defaults["attribution_link"]),
         "zenodo_doi": ensure_value(zenodo_doi(doi_list), fallback=defaults["zenodo_doi"]),
         "custom_citation": defaults["custom_citation"],
         "dependencies": ensure_value(deps, fallback=defaults["dependencies"]),
@@ -331,29 +591,21 @@ def build_metadata(package: str, payload: Dict) -> Dict:
 
 
 def build_markdown(package: str, metadata: Dict, bibtex_entries: List[str]) -> str:
-    lines = ["# Citation information", "```"]
+    buffer = io.StringIO()
+    write = buffer.write
+    write("# Citation information\n```\n")
     metadata_json = json.dumps(metadata, indent=4, sort_keys=False)
-    metadata_lines = metadata_json.splitlines()
-    if metadata_lines:
-        metadata_lines[0] = f"\"{package}\": {metadata_lines[0]}"
-    content = "\n".join(metadata_lines)
-    lines.append(content)
-    lines.append("```")
-    lines.append("")
-    lines.append("# BibTeX")
-    lines.append("```")
+    write(f"\"{package}\": {metadata_json}\n")
+    write("```\n\n# BibTeX\n```\n")
     if bibtex_entries:
-        entries = [
-            format_bibtex_entry(entry.strip())
-            for entry in bibtex_entries
-            if entry.strip()
-        ]
-        if entries:
-            lines.append("\n\n".join(entries))
+        entries = [entry.strip() for entry in bibtex_entries if entry.strip()]
+        for idx, entry in enumerate(entries):
+            write(format_bibtex_entry(entry))
+            write("\n\n" if idx < len(entries) - 1 else "\n")
     else:
-        lines.append("No BibTeX entries discovered.")
-    lines.append("```")
-    return "\n".join(lines) + "\n"
+        write("No BibTeX entries discovered.\n")
+    write("```\n")
+    return buffer.getvalue()
 
 
 def main(argv: List[str]) -> int:
@@ -369,18 +621,21 @@ def main(argv: List[str]) -> int:
     package = args.package
 
     try:
-        payload = get_pypi_payload(package)
-    except urllib.error.HTTPError as error:
-        parser.error(f"Failed to fetch '{package}' from PyPI: {error}")
-        return 1
-
-    metadata = build_metadata(package, payload)
-    dois = extract_dois(payload["info"])
-    bib_entries = []
-    for doi in dois:
-        bib = fetch_bibtex(doi)
-        if bib:
-            bib_entries.append(bib)
+        try:
+            payload = get_pypi_payload(package)
+        except urllib.error.HTTPError as error:
+            parser.error(f"Failed to fetch '{package}' from PyPI: {error}")
+            return 1
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Queue the BibTeX downloads first so they overlap with the CITATION probes.
+            dois = extract_dois(payload["info"])
+            bib_results = executor.map(fetch_bibtex, dois)
+            metadata = build_metadata(package, payload, executor, dois)
+            bib_entries = [bib for bib in bib_results if bib]
+        save_url_exists_cache()
+    finally:
+        close_connections()
 
     if not metadata["tags"]:
         metadata["tags"] = ["FIXME"]